@@ -10,18 +10,58 @@ This AI agent:
 """
 
 import asyncio
+import collections
+import functools
 import os
+import time
 import base64
+import binascii
 import json
+import logging
 import numpy as np
+import aiohttp
 from dotenv import load_dotenv
 from livekit import rtc
 from livekit.api import AccessToken, VideoGrants
-import websockets
+
+try:
+    from numba import njit, types
+except ImportError:
+    njit = None
+
+# Lower-overhead event loop when available (not supported on Windows)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Client-side voice activity detection when available (falls back to server VAD)
+try:
+    import webrtcvad
+    from _webrtcvad import Error as VadError  # not re-exported by webrtcvad
+except ImportError:
+    webrtcvad = None
+
+# Fast C JSON codec for OpenAI events when available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+else:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
 
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # Configuration
 LIVEKIT_URL = os.getenv('LIVEKIT_URL', 'ws://localhost:7880')
 LIVEKIT_API_KEY = os.getenv('LIVEKIT_API_KEY')
@@ -31,6 +71,36 @@ AI_IDENTITY = 'ai-agent'
 TARGET_ROOM = os.getenv('TARGET_ROOM', 'demo-room')
 OPENAI_REALTIME_URL = 'wss://api.openai.com/v1/realtime?model=gpt-4o-realtime-preview-2024-12-17'
 
+# Outbound audio batching (24kHz PCM16 mono)
+AUDIO_BATCH_BYTES = 1920  # 40ms
+AUDIO_BATCH_INTERVAL = 0.04
+AUDIO_SEND_QUEUE_MAXSIZE = 100  # frames (~1s at 10ms per frame)
+
+# Client VAD (opt-in, needs webrtcvad): commit the input buffer as soon as a speaker goes quiet
+CLIENT_VAD_REQUESTED = os.getenv('CLIENT_VAD', '').lower() in ('1', 'true', 'yes')
+CLIENT_VAD = CLIENT_VAD_REQUESTED and webrtcvad is not None
+VAD_AGGRESSIVENESS = 2  # 0 (least) .. 3 (most aggressive at filtering non-speech)
+VAD_MIN_SPEECH_MS = 200  # speech needed before a turn counts as started
+VAD_HANGOVER_MS = 300  # silence after speech that ends the turn
+VAD_PREROLL_MS = 500  # audio kept from before a turn starts (the speech that triggered it + 300ms padding)
+VAD_SAMPLE_RATES = (8000, 16000, 32000, 48000)  # rates webrtcvad accepts; others go to 16kHz
+VAD_WINDOW_MS = 10  # webrtcvad takes 10/20/30ms windows
+
+# Server-side turn detection, used when client VAD is unavailable
+SERVER_VAD_TURN_DETECTION = {
+    'type': 'server_vad',
+    'threshold': 0.5,
+    'prefix_padding_ms': 300,
+    'silence_duration_ms': 500
+}
+
+# Playback queue bound (AI audio chunks). Deltas arrive faster than real time,
+# so this must hold a whole response burst; past it the oldest chunk is dropped.
+PLAYBACK_QUEUE_MAXSIZE = 500
+
+# Number of distinct chunk sizes kept in the playback AudioFrame pool
+FRAME_POOL_SIZE = 8
+
 # Validate configuration
 if not LIVEKIT_API_KEY or not LIVEKIT_API_SECRET:
     raise ValueError('[ERROR] Missing LIVEKIT_API_KEY or LIVEKIT_API_SECRET')
@@ -54,65 +124,171 @@ def generate_ai_token(room_name: str) -> str:
     return token.to_jwt()
 
 
-def resample_audio(audio_data: np.ndarray, from_rate: int, to_rate: int) -> np.ndarray:
-    """Resample audio from one sample rate to another"""
+def resampled_length(input_length: int, from_rate: int, to_rate: int) -> int:
+    """Number of samples resample_audio produces for a given input length"""
+    return int(input_length * (to_rate / from_rate))
+
+
+def resample_audio(audio_data: np.ndarray, from_rate: int, to_rate: int, out: np.ndarray = None) -> np.ndarray:
+    """Resample audio from one sample rate to another
+
+    If given, `out` (int16, resampled_length() samples) receives the result and is returned.
+    """
     if from_rate == to_rate:
         return audio_data
-    
+
+    if out is None:
+        out = np.empty(resampled_length(len(audio_data), from_rate, to_rate), dtype=np.int16)
+
+    # 2:1 decimation (48kHz -> 24kHz): average each sample pair
+    if from_rate == 2 * to_rate and len(audio_data) % 2 == 0:
+        pairs = np.add(audio_data[::2], audio_data[1::2], dtype=np.int32)
+        np.right_shift(pairs, 1, out=pairs)
+        np.copyto(out, pairs, casting='unsafe')
+        return out
+
+    # Compiled scalar kernel when Numba is available
+    if _resample_linear_jit is not None:
+        _resample_linear_jit(np.ascontiguousarray(audio_data, dtype=np.int16), from_rate, to_rate, out)
+        return out
+
     # Simple linear interpolation resampling
+    if len(audio_data) < 2:
+        out[:] = audio_data[-1] if len(audio_data) else 0
+        return out
+
+    # Vectorized: two gathers and a weighted sum with tables cached per frame shape
+    src_index_int, src_index_next, w0, w1 = _resample_tables(len(audio_data), from_rate, to_rate)
+    output = audio_data[src_index_int] * w0
+    output += audio_data[src_index_next] * w1
+    np.copyto(out, output, casting='unsafe')
+    return out
+
+
+@functools.lru_cache(maxsize=8)
+def _resample_tables(n_in: int, from_rate: int, to_rate: int):
+    """Gather indices and interpolation weights for one input length and rate pair"""
     ratio = to_rate / from_rate
-    output_length = int(len(audio_data) * ratio)
-    
-    # Create output array
-    output = np.zeros(output_length, dtype=np.int16)
-    
-    for i in range(output_length):
+    output_length = resampled_length(n_in, from_rate, to_rate)
+
+    # Source positions, integer parts and fractional weights
+    src_index = np.arange(output_length, dtype=np.float32) / np.float32(ratio)
+    src_index_int = src_index.astype(np.int32)
+    frac = src_index - src_index_int
+
+    # Samples past the last pair hold the final sample (frac = 1 on the clipped pair)
+    last = n_in - 2
+    tail = src_index_int > last
+    np.minimum(src_index_int, last, out=src_index_int)
+    frac[tail] = 1.0
+
+    tables = (src_index_int, src_index_int + 1, 1 - frac, frac)
+    for table in tables:
+        table.setflags(write=False)  # shared across calls
+    return tables
+
+
+def _resample_linear_loop(audio_data, from_rate, to_rate, output):
+    """Scalar linear interpolation loop into `output`, compiled with Numba when available"""
+    ratio = to_rate / from_rate
+    last = len(audio_data) - 1
+
+    for i in range(len(output)):
         src_index = i / ratio
         src_index_int = int(src_index)
-        
-        if src_index_int < len(audio_data) - 1:
-            # Linear interpolation
+
+        if src_index_int < last:
             frac = src_index - src_index_int
-            output[i] = int(audio_data[src_index_int] * (1 - frac) + 
-                          audio_data[src_index_int + 1] * frac)
+            output[i] = int(audio_data[src_index_int] * (1 - frac) +
+                            audio_data[src_index_int + 1] * frac)
         else:
-            output[i] = audio_data[-1]
-    
-    return output
+            output[i] = audio_data[last]
+
+
+if njit is not None:
+    # Explicit signatures compile at import, so the first audio frame never waits on the JIT.
+    # Frames decoded straight from bytes are read-only, hence the second signature.
+    _resample_linear_jit = njit(
+        [
+            types.void(types.int16[::1], types.int64, types.int64, types.int16[::1]),
+            types.void(types.Array(types.int16, 1, 'C', readonly=True), types.int64, types.int64, types.int16[::1]),
+        ],
+        cache=True,
+        fastmath=True,
+        boundscheck=False,
+    )(_resample_linear_loop)
+else:
+    _resample_linear_jit = None
 
 
 class OpenAIRealtimeSession:
     """Manages connection to OpenAI Realtime API"""
     
     def __init__(self, ai_agent):
+        self.http_session = None
         self.ws = None
         self.connected = False
         self.session_id = None
         self.audio_chunks_sent = 0
         self.audio_chunks_received = 0
+        self.audio_chunks_dropped = 0
         self.text_responses_received = 0
         self.ai_agent = ai_agent
+        # Turn detection mode; client VAD hands it to the server if a track can't be analyzed
+        self.server_vad = not CLIENT_VAD
+        # Pre-built JSON envelope for input_audio_buffer.append (base64 needs no escaping)
+        self._append_prefix = b'{"type":"input_audio_buffer.append","audio":"'
+        self._append_suffix = b'"}'
+        self._outbuf = bytearray()
+        # Resampled audio handed from track handlers to the sender
+        self._outbound_audio = asyncio.Queue(maxsize=AUDIO_SEND_QUEUE_MAXSIZE)
+        # End of user turn requested; kept out of the queue so overflow can't drop it
+        self._commit_pending = False
+        # A response is in progress (response.create sent / response.created, until response.done)
+        self.response_active = False
+        # Hot paths start with first-N diagnostics, then swap to branch-free versions
+        self.send_audio = self._send_audio_with_logging
+        # Inbound event dispatch table (type -> handler)
+        self._handlers = {
+            'session.created': self._on_session_created,
+            'session.updated': self._on_session_updated,
+            'input_audio_buffer.speech_started': self._on_speech_started,
+            'input_audio_buffer.speech_stopped': self._on_speech_stopped,
+            'input_audio_buffer.committed': self._on_buffer_committed,
+            'conversation.item.input_audio_transcription.completed': self._on_transcription_completed,
+            'response.audio_transcript.delta': self._on_transcript_delta,
+            'response.audio_transcript.done': self._on_transcript_done,
+            'response.audio.delta': self._on_audio_delta_with_logging,
+            'response.audio.done': self._on_audio_done,
+            'response.created': self._on_response_created,
+            'response.done': self._on_response_done,
+            'error': self._on_error,
+        }
         
     async def connect(self):
         """Connect to OpenAI Realtime API"""
-        print('[OPENAI] Connecting to Realtime API...')
-        print(f'[OPENAI] URL: {OPENAI_REALTIME_URL}')
+        logger.info('[OPENAI] Connecting to Realtime API...')
+        logger.info('[OPENAI] URL: %s', OPENAI_REALTIME_URL)
         
         headers = {
             'Authorization': f'Bearer {OPENAI_API_KEY}',
             'OpenAI-Beta': 'realtime=v1'
         }
         
-        self.ws = await websockets.connect(OPENAI_REALTIME_URL, extra_headers=headers)
+        self.http_session = aiohttp.ClientSession()
+        self.ws = await self.http_session.ws_connect(OPENAI_REALTIME_URL, headers=headers, max_msg_size=0)
         self.connected = True
-        print('[OPENAI] ✅ WebSocket connected')
+        logger.info('[OPENAI] ✅ WebSocket connected')
         
         # Initialize session
         await self.initialize_session()
         
+        # Start batched audio sender
+        asyncio.create_task(self._send_loop())
+        
     async def initialize_session(self):
         """Configure OpenAI session"""
-        print('[OPENAI] Initializing session...')
+        logger.info('[OPENAI] Initializing session...')
         
         session_config = {
             'type': 'session.update',
@@ -125,117 +301,225 @@ class OpenAIRealtimeSession:
                 'input_audio_transcription': {
                     'model': 'whisper-1'
                 },
-                'turn_detection': {
-                    'type': 'server_vad',
-                    'threshold': 0.5,
-                    'prefix_padding_ms': 300,
-                    'silence_duration_ms': 500
-                }
+                # With client VAD the agent commits turns itself (see request_response)
+                'turn_detection': SERVER_VAD_TURN_DETECTION if self.server_vad else None
             }
         }
         
-        await self.ws.send(json.dumps(session_config))
-        print('[OPENAI] Session configuration sent')
+        await self.ws.send_str(_json_dumps(session_config))
+        logger.info('[OPENAI] Session configuration sent (turn detection: %s)', 'server' if self.server_vad else 'client VAD')
+        if CLIENT_VAD_REQUESTED and not CLIENT_VAD:
+            logger.warning('[OPENAI] ⚠️  CLIENT_VAD is set but webrtcvad is not installed, using server VAD')
+    
+    async def enable_server_vad(self):
+        """Hand turn detection back to the server (client VAD failed on a track)"""
+        if self.server_vad or not self.connected:
+            return
         
-    async def send_audio(self, audio_data: bytes):
-        """Send audio to OpenAI"""
+        self.server_vad = True
+        await self.ws.send_str(_json_dumps({
+            'type': 'session.update',
+            'session': {'turn_detection': SERVER_VAD_TURN_DETECTION}
+        }))
+        logger.warning('[OPENAI] ⚠️  Switched to server VAD')
+        
+    def enqueue_audio(self, audio_data: bytes):
+        """Queue audio for the batched sender (drops the oldest frame if the sender falls behind)"""
         if not self.connected:
             return
-            
-        # Encode as base64
-        base64_audio = base64.b64encode(audio_data).decode('utf-8')
         
-        message = {
-            'type': 'input_audio_buffer.append',
-            'audio': base64_audio
-        }
+        try:
+            self._outbound_audio.put_nowait(audio_data)
+        except asyncio.QueueFull:
+            self._outbound_audio.get_nowait()
+            self._outbound_audio.put_nowait(audio_data)
+            self.audio_chunks_dropped += 1
+            if self.audio_chunks_dropped == 1:
+                logger.warning('[OPENAI] ⚠️  Send queue full (%s frames), dropping oldest user audio', AUDIO_SEND_QUEUE_MAXSIZE)
+    
+    def request_response(self):
+        """Commit the input buffer and ask for a response once already-queued audio is sent"""
+        if not self.connected:
+            return
+        
+        self._commit_pending = True
+        # None only wakes the sender; a full queue already will
+        try:
+            self._outbound_audio.put_nowait(None)
+        except asyncio.QueueFull:
+            pass
+    
+    async def _send_loop(self):
+        """Drain queued audio and send it in ~40ms batches"""
+        pending = bytearray()
+        last_flush = time.monotonic()
         
-        await self.ws.send(json.dumps(message))
+        try:
+            while self.connected:
+                # Wake up only when audio arrives, then take whatever else is already queued
+                chunk = await self._outbound_audio.get()
+                while True:
+                    if chunk is not None:
+                        pending += chunk
+                    
+                    if len(pending) >= AUDIO_BATCH_BYTES or self._outbound_audio.empty():
+                        break
+                    chunk = self._outbound_audio.get_nowait()
+                
+                if self._commit_pending and self._outbound_audio.empty():
+                    # End of user turn (all audio queued before it is drained): flush, commit, respond
+                    self._commit_pending = False
+                    if pending:
+                        await self.send_audio(pending)
+                        pending.clear()
+                    await self.ws.send_str('{"type":"input_audio_buffer.commit"}')
+                    if self.response_active:
+                        # User talked over the agent; without server VAD nothing cancels the old response
+                        logger.info('[OPENAI] Cancelling active response for new user turn')
+                        await self.ws.send_str('{"type":"response.cancel"}')
+                    await self.ws.send_str('{"type":"response.create"}')
+                    self.response_active = True
+                    last_flush = time.monotonic()
+                    continue
+                
+                now = time.monotonic()
+                if pending and (len(pending) >= AUDIO_BATCH_BYTES or now - last_flush >= AUDIO_BATCH_INTERVAL):
+                    last_flush = now
+                    # Encoded straight from the batch buffer; it is cleared only after the send
+                    await self.send_audio(pending)
+                    pending.clear()
+        except Exception as e:
+            logger.error('[OPENAI] Error in audio send loop: %s', e)
+            self.connected = False
+    
+    async def _send_audio_fast(self, audio_data: bytes):
+        """Send audio to OpenAI"""
+        # Encode as base64 straight into the reused envelope buffer (no dict / json.dumps per chunk).
+        # Sent as str (a text frame), which the Realtime API expects for JSON events.
+        outbuf = self._outbuf
+        outbuf.clear()
+        outbuf += self._append_prefix
+        outbuf += binascii.b2a_base64(audio_data, newline=False)
+        outbuf += self._append_suffix
+        
+        await self.ws.send_str(outbuf.decode('ascii'))
         self.audio_chunks_sent += 1
+    
+    async def _send_audio_with_logging(self, audio_data: bytes):
+        """Send audio to OpenAI, logging the first few chunks"""
+        await self._send_audio_fast(audio_data)
         
-        if self.audio_chunks_sent <= 3:
-            size_kb = len(base64_audio) * 0.75 / 1024
-            print(f'[OPENAI] ✅ TEST 3.2: Sent audio chunk #{self.audio_chunks_sent} ({size_kb:.2f} KB)')
+        size_kb = len(audio_data) / 1024
+        logger.info('[OPENAI] ✅ TEST 3.2: Sent audio chunk #%s (%.2f KB)', self.audio_chunks_sent, size_kb)
+        
+        if self.audio_chunks_sent >= 3:
+            self.send_audio = self._send_audio_fast
     
     async def handle_message(self, message_data: dict):
         """Handle messages from OpenAI"""
-        msg_type = message_data.get('type')
+        handler = self._handlers.get(message_data.get('type'))
+        if handler:
+            await handler(message_data)
+    
+    async def _on_session_created(self, message_data: dict):
+        self.session_id = message_data['session']['id']
+        logger.info('[OPENAI] ✅ TEST 3.1 PASS: Session created')
+        logger.info('[OPENAI] Session ID: %s', self.session_id)
+        logger.info('[OPENAI] Model: %s', message_data["session"]["model"])
+    
+    async def _on_session_updated(self, message_data: dict):
+        logger.info('[OPENAI] Session updated successfully')
+    
+    async def _on_speech_started(self, message_data: dict):
+        logger.info('[OPENAI] 🎤 Speech detected (VAD)')
+    
+    async def _on_speech_stopped(self, message_data: dict):
+        logger.info('[OPENAI] 🔇 Speech ended (VAD)')
+    
+    async def _on_buffer_committed(self, message_data: dict):
+        logger.info('[OPENAI] Audio buffer committed')
+    
+    async def _on_transcription_completed(self, message_data: dict):
+        transcript = message_data.get('transcript', '')
+        logger.info('[OPENAI] 📝 Transcription: "%s"', transcript)
+        logger.info('[OPENAI] ✅ TEST 3.3 PASS: Received text transcription')
+        self.text_responses_received += 1
+    
+    async def _on_transcript_delta(self, message_data: dict):
+        logger.debug('[OPENAI] 🤖 %s', message_data.get('delta', ''))
+    
+    async def _on_transcript_done(self, message_data: dict):
+        transcript = message_data.get('transcript', '')
+        logger.info('[OPENAI] 🤖 AI Response: "%s"', transcript)
+    
+    async def _on_audio_done(self, message_data: dict):
+        logger.info('[OPENAI] 🔊 Audio response completed')
+        if self.audio_chunks_received > 0:
+            logger.info('[OPENAI] Total audio chunks received: %s', self.audio_chunks_received)
+        # Reset counter and first-chunk diagnostics for next response
+        self.audio_chunks_received = 0
+        self._handlers['response.audio.delta'] = self._on_audio_delta_with_logging
+    
+    async def _on_response_created(self, message_data: dict):
+        self.response_active = True
+    
+    async def _on_response_done(self, message_data: dict):
+        self.response_active = False
+        logger.info('[OPENAI] Response completed')
+    
+    async def _on_error(self, message_data: dict):
+        error = message_data.get('error', {})
+        logger.error('[OPENAI] ❌ Error: %s', error)
+    
+    async def _on_audio_delta_fast(self, message_data: dict):
+        """Decode an AI audio delta and queue it for playback"""
+        self.audio_chunks_received += 1
+        self.ai_agent.play_audio_in_room(base64.b64decode(message_data.get('delta', '')))
+    
+    async def _on_audio_delta_with_logging(self, message_data: dict):
+        """Decode an AI audio delta, logging the first few chunks of a response"""
+        # Receive AI audio from OpenAI
+        self.audio_chunks_received += 1
         
-        if msg_type == 'session.created':
-            self.session_id = message_data['session']['id']
-            print('[OPENAI] ✅ TEST 3.1 PASS: Session created')
-            print(f'[OPENAI] Session ID: {self.session_id}')
-            print(f'[OPENAI] Model: {message_data["session"]["model"]}')
-            
-        elif msg_type == 'session.updated':
-            print('[OPENAI] Session updated successfully')
-            
-        elif msg_type == 'input_audio_buffer.speech_started':
-            print('[OPENAI] 🎤 Speech detected (VAD)')
-            
-        elif msg_type == 'input_audio_buffer.speech_stopped':
-            print('[OPENAI] 🔇 Speech ended (VAD)')
-            
-        elif msg_type == 'input_audio_buffer.committed':
-            print('[OPENAI] Audio buffer committed')
-            
-        elif msg_type == 'conversation.item.input_audio_transcription.completed':
-            transcript = message_data.get('transcript', '')
-            print(f'[OPENAI] 📝 Transcription: "{transcript}"')
-            print('[OPENAI] ✅ TEST 3.3 PASS: Received text transcription')
-            self.text_responses_received += 1
-            
-        elif msg_type == 'response.audio_transcript.delta':
-            delta = message_data.get('delta', '')
-            print(delta, end='', flush=True)
-            
-        elif msg_type == 'response.audio_transcript.done':
-            transcript = message_data.get('transcript', '')
-            print(f'\n[OPENAI] 🤖 AI Response: "{transcript}"')
-            
-        elif msg_type == 'response.audio.delta':
-            # Receive AI audio from OpenAI
-            self.audio_chunks_received += 1
-            
-            # Decode base64 to PCM16 buffer
-            delta = message_data.get('delta', '')
-            pcm16_buffer = base64.b64decode(delta)
-            
-            if self.audio_chunks_received <= 3:
-                size_kb = len(delta) * 0.75 / 1024
-                print(f'[OPENAI] ✅ TEST 4.1: Received audio delta #{self.audio_chunks_received} ({size_kb:.2f} KB, {len(pcm16_buffer)} bytes PCM16)')
-            
-            # Forward to AI agent for playback
-            if self.ai_agent and self.ai_agent.audio_source:
-                await self.ai_agent.play_audio_in_room(pcm16_buffer)
-                if self.audio_chunks_received <= 3:
-                    print(f'[OPENAI] 📤 Queued audio chunk #{self.audio_chunks_received} for playback')
-            else:
-                print(f'[OPENAI] ⚠️ Cannot queue audio - ai_agent={self.ai_agent is not None}, audio_source={self.ai_agent.audio_source if self.ai_agent else None}')
-                
-        elif msg_type == 'response.audio.done':
-            print('[OPENAI] 🔊 Audio response completed')
-            if self.audio_chunks_received > 0:
-                print(f'[OPENAI] Total audio chunks received: {self.audio_chunks_received}')
-            # Reset counter for next response
-            self.audio_chunks_received = 0
-            
-        elif msg_type == 'response.done':
-            print('[OPENAI] Response completed')
-            
-        elif msg_type == 'error':
-            error = message_data.get('error', {})
-            print(f'[OPENAI] ❌ Error: {error}')
+        # Decode base64 to PCM16 buffer
+        delta = message_data.get('delta', '')
+        pcm16_buffer = base64.b64decode(delta)
+        
+        size_kb = len(delta) * 0.75 / 1024
+        logger.info('[OPENAI] ✅ TEST 4.1: Received audio delta #%s (%.2f KB, %s bytes PCM16)', self.audio_chunks_received, size_kb, len(pcm16_buffer))
+        
+        # Forward to AI agent for playback
+        if self.ai_agent and self.ai_agent.audio_source:
+            self.ai_agent.play_audio_in_room(pcm16_buffer)
+            logger.info('[OPENAI] 📤 Queued audio chunk #%s for playback', self.audio_chunks_received)
+        else:
+            logger.warning('[OPENAI] ⚠️ Cannot queue audio - ai_agent=%s, audio_source=%s', self.ai_agent is not None, self.ai_agent.audio_source if self.ai_agent else None)
+        
+        if self.audio_chunks_received >= 3:
+            self._handlers['response.audio.delta'] = self._on_audio_delta_fast
     
     async def listen(self):
         """Listen for messages from OpenAI"""
         try:
             async for message in self.ws:
-                data = json.loads(message)
-                await self.handle_message(data)
+                if message.type == aiohttp.WSMsgType.TEXT:
+                    data = _json_loads(message.data)
+                    await self.handle_message(data)
+                elif message.type == aiohttp.WSMsgType.ERROR:
+                    raise self.ws.exception() or ConnectionError('WebSocket error')
         except Exception as e:
-            print(f'[OPENAI] Error in listen loop: {e}')
+            logger.error('[OPENAI] Error in listen loop: %s', e)
             self.connected = False
+    
+    async def close(self):
+        """Close the WebSocket and its HTTP session"""
+        self.connected = False
+        
+        if self.ws:
+            await self.ws.close()
+        
+        if self.http_session:
+            await self.http_session.close()
 
 
 class AIAgent:
@@ -249,35 +533,37 @@ class AIAgent:
         self.audio_source = None
         self.audio_track = None
         self.audio_frames_published = 0
-        self.audio_queue = asyncio.Queue()
+        self.audio_queue = asyncio.Queue(maxsize=PLAYBACK_QUEUE_MAXSIZE)
+        self.audio_chunks_dropped = 0
+        self._frame_pool = {}  # samples_per_channel -> reusable rtc.AudioFrame
         self.is_processing_audio = False
         
     async def connect(self, room_name: str):
         """Connect to LiveKit room and OpenAI"""
         try:
             # First connect to OpenAI
-            print('\n[STEP 3] Connecting to OpenAI Realtime API...')
+            logger.info('\n[STEP 3] Connecting to OpenAI Realtime API...')
             await self.openai.connect()
-            print('[STEP 3] ✅ OpenAI connected\n')
+            logger.info('[STEP 3] ✅ OpenAI connected\n')
             
             # Then connect to LiveKit
-            print('[AI-AGENT] Generating token for room:', room_name)
+            logger.info('[AI-AGENT] Generating token for room: %s', room_name)
             token = generate_ai_token(room_name)
             
-            print('[AI-AGENT] Creating room instance...')
+            logger.info('[AI-AGENT] Creating room instance...')
             self.room = rtc.Room()
             
             # Set up event handlers
             self.setup_event_handlers()
             
-            print('[AI-AGENT] Connecting to LiveKit...')
+            logger.info('[AI-AGENT] Connecting to LiveKit...')
             await self.room.connect(LIVEKIT_URL, token)
             
-            print('[AI-AGENT] ✅ Successfully connected to room!')
-            print(f'[AI-AGENT] Room name: {self.room.name}')
-            print(f'[AI-AGENT] Local participant SID: {self.room.local_participant.sid}')
-            print(f'[AI-AGENT] Local participant identity: {self.room.local_participant.identity}')
-            print(f'[AI-AGENT] Remote participants: {len(self.room.remote_participants)}')
+            logger.info('[AI-AGENT] ✅ Successfully connected to room!')
+            logger.info('[AI-AGENT] Room name: %s', self.room.name)
+            logger.info('[AI-AGENT] Local participant SID: %s', self.room.local_participant.sid)
+            logger.info('[AI-AGENT] Local participant identity: %s', self.room.local_participant.identity)
+            logger.info('[AI-AGENT] Remote participants: %s', len(self.room.remote_participants))
             
             # Setup audio publishing
             await self.setup_audio_publishing()
@@ -291,7 +577,7 @@ class AIAgent:
             return True
             
         except Exception as e:
-            print(f'[AI-AGENT] ❌ Connection failed: {e}')
+            logger.error('[AI-AGENT] ❌ Connection failed: %s', e)
             return False
     
     def setup_event_handlers(self):
@@ -299,18 +585,18 @@ class AIAgent:
         
         @self.room.on('participant_connected')
         def on_participant_connected(participant: rtc.RemoteParticipant):
-            print(f'[AI-AGENT] 👤 Participant joined: {participant.identity}')
-            print(f'[AI-AGENT]    - SID: {participant.sid}')
+            logger.info('[AI-AGENT] 👤 Participant joined: %s', participant.identity)
+            logger.info('[AI-AGENT]    - SID: %s', participant.sid)
             
         @self.room.on('participant_disconnected')
         def on_participant_disconnected(participant: rtc.RemoteParticipant):
-            print(f'[AI-AGENT] 👋 Participant left: {participant.identity}')
+            logger.info('[AI-AGENT] 👋 Participant left: %s', participant.identity)
             if participant.identity in self.subscribed_tracks:
                 del self.subscribed_tracks[participant.identity]
         
         @self.room.on('track_published')
         def on_track_published(publication: rtc.RemoteTrackPublication, participant: rtc.RemoteParticipant):
-            print(f'[AI-AGENT] 📢 Track published by {participant.identity}: {publication.kind}')
+            logger.info('[AI-AGENT] 📢 Track published by %s: %s', participant.identity, publication.kind)
         
         @self.room.on('track_subscribed')
         def on_track_subscribed(
@@ -318,28 +604,28 @@ class AIAgent:
             publication: rtc.RemoteTrackPublication,
             participant: rtc.RemoteParticipant
         ):
-            print(f'[AI-AGENT] 🎧 TrackSubscribed Event:')
-            print(f'[AI-AGENT]    - Participant: {participant.identity}')
-            print(f'[AI-AGENT]    - Track kind: {track.kind}')
-            print(f'[AI-AGENT]    - Track SID: {track.sid}')
+            logger.info('[AI-AGENT] 🎧 TrackSubscribed Event:')
+            logger.info('[AI-AGENT]    - Participant: %s', participant.identity)
+            logger.info('[AI-AGENT]    - Track kind: %s', track.kind)
+            logger.info('[AI-AGENT]    - Track SID: %s', track.sid)
             
             if track.kind == rtc.TrackKind.KIND_AUDIO:
-                print(f'[AI-AGENT] ✅ TEST 2.2 PASS: Subscribed to audio from {participant.identity}')
+                logger.info('[AI-AGENT] ✅ TEST 2.2 PASS: Subscribed to audio from %s', participant.identity)
                 asyncio.create_task(self.handle_audio_track(track, participant))
         
         @self.room.on('active_speakers_changed')
         def on_active_speakers_changed(speakers):
             speaker_identities = [s.identity for s in speakers]
             if speaker_identities:
-                print(f'[AI-AGENT] 🗣️  Active speakers: {", ".join(speaker_identities)}')
+                logger.info('[AI-AGENT] 🗣️  Active speakers: %s', ", ".join(speaker_identities))
     
     async def handle_audio_track(self, track: rtc.AudioTrack, participant: rtc.RemoteParticipant):
         """Handle incoming audio track from participant"""
-        print(f'[AI-AGENT] 🎵 Setting up audio track handler for {participant.identity}')
+        logger.info('[AI-AGENT] 🎵 Setting up audio track handler for %s', participant.identity)
         
         audio_stream = rtc.AudioStream(track)
-        print(f'[AI-AGENT] ✅ Audio track handler configured for {participant.identity}')
-        print('[AI-AGENT]    Ready to receive audio data...')
+        logger.info('[AI-AGENT] ✅ Audio track handler configured for %s', participant.identity)
+        logger.info('[AI-AGENT]    Ready to receive audio data...')
         
         # Track stats
         if participant.identity not in self.subscribed_tracks:
@@ -349,84 +635,177 @@ class AIAgent:
                 'last_log': 0
             }
         
-        async for event in audio_stream:
-            frame = event.frame
-            self.audio_frame_count += 1
-            stats = self.subscribed_tracks[participant.identity]
-            stats['frames'] += 1
-            stats['bytes'] += len(frame.data)
-            
-            # Log first few frames
-            if self.audio_frame_count <= 3:
-                print(f'[AI-AGENT] 🎵 Audio frame #{self.audio_frame_count}:')
-                print(f'[AI-AGENT]    - Size: {len(frame.data)} bytes')
-                print(f'[AI-AGENT]    - Sample rate: {frame.sample_rate} Hz')
-                print(f'[AI-AGENT]    - Channels: {frame.num_channels}')
-                print(f'[AI-AGENT]    - Samples per channel: {frame.samples_per_channel}')
+        # Count in locals; the shared stats dict is only written every 500 frames
+        stats = self.subscribed_tracks[participant.identity]
+        resample_out = None  # reused int16 output buffer for this track
+        
+        # Client VAD state (frames are converted to mono at a webrtcvad rate, cut into 10ms windows)
+        vad = webrtcvad.Vad(VAD_AGGRESSIVENESS) if CLIENT_VAD else None
+        vad_rate = 0
+        vad_pending = b''
+        preroll = collections.deque()  # (24kHz chunk, ms) held between turns
+        preroll_ms = 0
+        in_speech = False
+        speech_ms = 0
+        silence_ms = 0
+        frames = stats['frames']
+        bytes_ = stats['bytes']
+        flushed_frames = frames
+        
+        try:
+            async for event in audio_stream:
+                frame = event.frame
+                frames += 1
+                bytes_ += len(frame.data)
                 
-                if self.audio_frame_count == 3:
-                    print('[AI-AGENT] ✅ TEST 2.3 PASS: Receiving audio frames from', participant.identity)
-            
-            # Convert frame data to numpy array
-            audio_data = np.frombuffer(frame.data, dtype=np.int16)
-            
-            # Resample from 48kHz to 24kHz for OpenAI
-            resampled = resample_audio(audio_data, frame.sample_rate, 24000)
-            
-            # Send to OpenAI
-            await self.openai.send_audio(resampled.tobytes())
-            
-            # Log stats periodically
-            if stats['frames'] % 500 == 0:
-                avg_size = stats['bytes'] / stats['frames']
-                print(f'[AI-AGENT] 📊 Audio stats for {participant.identity}:')
-                print(f'[AI-AGENT]    - Total frames: {stats["frames"]}')
-                print(f'[AI-AGENT]    - Total bytes: {stats["bytes"]}')
-                print(f'[AI-AGENT]    - Avg frame size: {int(avg_size)} bytes')
+                # Log first few frames
+                if frames <= 3:
+                    logger.info('[AI-AGENT] 🎵 Audio frame #%s:', frames)
+                    logger.info('[AI-AGENT]    - Size: %s bytes', len(frame.data))
+                    logger.info('[AI-AGENT]    - Sample rate: %s Hz', frame.sample_rate)
+                    logger.info('[AI-AGENT]    - Channels: %s', frame.num_channels)
+                    logger.info('[AI-AGENT]    - Samples per channel: %s', frame.samples_per_channel)
+                    
+                    if frames == 3:
+                        logger.info('[AI-AGENT] ✅ TEST 2.3 PASS: Receiving audio frames from %s', participant.identity)
+                
+                # Convert frame data to numpy array
+                audio_data = np.frombuffer(frame.data, dtype=np.int16)
+                
+                # Send to OpenAI (resampled from 48kHz to 24kHz unless already 24kHz)
+                if frame.sample_rate == 24000:
+                    chunk = frame.data
+                else:
+                    n_out = resampled_length(len(audio_data), frame.sample_rate, 24000)
+                    if resample_out is None or len(resample_out) != n_out:
+                        resample_out = np.empty(n_out, dtype=np.int16)
+                    resample_audio(audio_data, frame.sample_rate, 24000, out=resample_out)
+                    # The queue needs its own copy since resample_out is rewritten next frame
+                    chunk = resample_out.tobytes()
+                
+                client_vad = vad is not None and not self.openai.server_vad
+                if client_vad and not in_speech:
+                    # Between turns keep only a short pre-roll, so a commit carries just the turn
+                    frame_ms = frame.samples_per_channel * 1000 // frame.sample_rate
+                    preroll.append((chunk, frame_ms))
+                    preroll_ms += frame_ms
+                    while preroll_ms > VAD_PREROLL_MS:
+                        preroll_ms -= preroll.popleft()[1]
+                else:
+                    self.openai.enqueue_audio(chunk)
+                
+                # Detect end of speech locally and commit right away
+                if client_vad:
+                    mono = audio_data if frame.num_channels == 1 else audio_data[::frame.num_channels]
+                    rate = frame.sample_rate if frame.sample_rate in VAD_SAMPLE_RATES else 16000
+                    if rate != frame.sample_rate:
+                        mono = resample_audio(mono, frame.sample_rate, rate)
+                    if rate != vad_rate:
+                        vad_rate = rate
+                        vad_pending = b''
+                    vad_pending += mono.tobytes()
+                    window = vad_rate * VAD_WINDOW_MS // 1000 * 2  # bytes
+                    end = len(vad_pending) - len(vad_pending) % window
+                    
+                    try:
+                        for offset in range(0, end, window):
+                            if vad.is_speech(vad_pending[offset:offset + window], vad_rate):
+                                speech_ms += VAD_WINDOW_MS
+                                silence_ms = 0
+                                if not in_speech and speech_ms >= VAD_MIN_SPEECH_MS:
+                                    in_speech = True
+                                    # Turn starts: send the pre-roll (this frame included)
+                                    for buffered, _ in preroll:
+                                        self.openai.enqueue_audio(buffered)
+                                    preroll.clear()
+                                    preroll_ms = 0
+                            elif in_speech:
+                                silence_ms += VAD_WINDOW_MS
+                                if silence_ms >= VAD_HANGOVER_MS:
+                                    logger.info('[AI-AGENT] 🔇 End of speech from %s (client VAD), committing audio', participant.identity)
+                                    self.openai.request_response()
+                                    in_speech = False
+                                    speech_ms = 0
+                                    silence_ms = 0
+                            else:
+                                speech_ms = 0
+                    except VadError as e:
+                        logger.warning('[AI-AGENT] ⚠️  Client VAD failed for %s (%s), falling back to server VAD',
+                                       participant.identity, e)
+                        vad = None
+                        for buffered, _ in preroll:
+                            self.openai.enqueue_audio(buffered)
+                        preroll.clear()
+                        preroll_ms = 0
+                        await self.openai.enable_server_vad()
+                    vad_pending = vad_pending[end:]
+                
+                # Flush counters and log stats periodically
+                if frames % 500 == 0:
+                    self.audio_frame_count += frames - flushed_frames
+                    flushed_frames = stats['frames'] = frames
+                    stats['bytes'] = bytes_
+                    
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info('[AI-AGENT] 📊 Audio stats for %s:', participant.identity)
+                        logger.info('[AI-AGENT]    - Total frames: %s', frames)
+                        logger.info('[AI-AGENT]    - Total bytes: %s', bytes_)
+                        logger.info('[AI-AGENT]    - Avg frame size: %s bytes', int(bytes_ / frames))
+        finally:
+            self.audio_frame_count += frames - flushed_frames
+            stats['frames'] = frames
+            stats['bytes'] = bytes_
     
     async def setup_audio_publishing(self):
         """Setup audio publishing for AI responses"""
         try:
-            print('\n[STEP 5] Setting up AI audio publishing...')
+            logger.info('\n[STEP 5] Setting up AI audio publishing...')
             
             # Create audio source (24kHz, mono)
             self.audio_source = rtc.AudioSource(24000, 1)
-            print('[STEP 5] AudioSource created (24kHz, mono)')
+            logger.info('[STEP 5] AudioSource created (24kHz, mono)')
             
             # Create local audio track
             self.audio_track = rtc.LocalAudioTrack.create_audio_track('ai-voice', self.audio_source)
-            print('[STEP 5] LocalAudioTrack created')
+            logger.info('[STEP 5] LocalAudioTrack created')
             
             # Publish track to room
             await self.room.local_participant.publish_track(self.audio_track)
             
-            print('[STEP 5] ✅ TEST 5.1 PASS: AI audio track published to room')
-            print('[STEP 5] Track name: ai-voice')
-            print('[STEP 5] Users can now hear AI responses\n')
+            logger.info('[STEP 5] ✅ TEST 5.1 PASS: AI audio track published to room')
+            logger.info('[STEP 5] Track name: ai-voice')
+            logger.info('[STEP 5] Users can now hear AI responses\n')
             
             # Start audio queue processor
             asyncio.create_task(self.process_audio_queue())
             
         except Exception as e:
-            print(f'[STEP 5] ❌ Failed to setup audio publishing: {e}')
+            logger.error('[STEP 5] ❌ Failed to setup audio publishing: %s', e)
             raise
     
-    async def play_audio_in_room(self, pcm16_buffer: bytes):
-        """Queue audio for playback in room"""
+    def play_audio_in_room(self, pcm16_buffer: bytes):
+        """Queue decoded PCM16 audio for playback in room"""
         if not self.audio_source:
-            print('[AI-AGENT] ⚠️  AudioSource not ready, skipping audio frame')
+            logger.warning('[AI-AGENT] ⚠️  AudioSource not ready, skipping audio frame')
             return
         
-        # Add to queue
-        await self.audio_queue.put(pcm16_buffer)
-        queue_size = self.audio_queue.qsize()
+        # Add to queue (raw bytes, no copy); drop the oldest chunk to keep latency bounded
+        try:
+            self.audio_queue.put_nowait(pcm16_buffer)
+        except asyncio.QueueFull:
+            self.audio_queue.get_nowait()
+            self.audio_queue.task_done()
+            self.audio_queue.put_nowait(pcm16_buffer)
+            self.audio_chunks_dropped += 1
+            if self.audio_chunks_dropped == 1:
+                logger.warning('[AI-AGENT] ⚠️  Playback queue full (%s chunks), dropping oldest audio', PLAYBACK_QUEUE_MAXSIZE)
         
-        if self.audio_frames_published < 3 or queue_size <= 5:
-            print(f'[AI-AGENT] 📥 Added audio chunk to queue (queue size: {queue_size}, published: {self.audio_frames_published})')
+        if self.audio_frames_published < 3:
+            logger.info('[AI-AGENT] 📥 Added audio chunk to queue (queue size: %s, published: %s)', self.audio_queue.qsize(), self.audio_frames_published)
     
     async def process_audio_queue(self):
         """Process audio queue sequentially"""
-        print('[AI-AGENT] 🎵 Audio queue processor started')
+        logger.info('[AI-AGENT] 🎵 Audio queue processor started')
         
         while True:
             try:
@@ -434,77 +813,86 @@ class AIAgent:
                 pcm16_buffer = await self.audio_queue.get()
                 
                 if self.audio_frames_published < 3:
-                    print(f'[AI-AGENT] 🎬 Processing audio chunk from queue ({len(pcm16_buffer)} bytes)')
-                
-                # Convert to numpy array
-                audio_data = np.frombuffer(pcm16_buffer, dtype=np.int16)
+                    logger.info('[AI-AGENT] 🎬 Processing audio chunk from queue (%s bytes)', len(pcm16_buffer))
                 
-                # Create audio frame
-                frame = rtc.AudioFrame(
-                    data=audio_data.tobytes(),
-                    sample_rate=24000,
-                    num_channels=1,
-                    samples_per_channel=len(audio_data)
-                )
+                # Reuse a pooled frame of this size, or create one straight from the PCM16 bytes
+                samples_per_channel = len(pcm16_buffer) >> 1
+                frame = self._frame_pool.get(samples_per_channel)
+                if frame is None:
+                    frame = rtc.AudioFrame(
+                        data=pcm16_buffer,
+                        sample_rate=24000,
+                        num_channels=1,
+                        samples_per_channel=samples_per_channel
+                    )
+                    if len(self._frame_pool) >= FRAME_POOL_SIZE:
+                        del self._frame_pool[next(iter(self._frame_pool))]
+                    self._frame_pool[samples_per_channel] = frame
+                else:
+                    # Safe to overwrite: the previous capture_frame on this frame has completed
+                    memoryview(frame.data).cast('B')[:] = memoryview(pcm16_buffer)[:samples_per_channel << 1]
                 
-                # Capture frame
+                # Capture frame (applies back-pressure from the source's buffer)
                 await self.audio_source.capture_frame(frame)
+                self.audio_queue.task_done()
                 self.audio_frames_published += 1
                 
                 # Log first few frames
                 if self.audio_frames_published <= 3:
-                    print(f'[AI-AGENT] ✅ TEST 5.2: Published AI audio frame #{self.audio_frames_published} to LiveKit ({len(audio_data)} samples)')
+                    logger.info('[AI-AGENT] ✅ TEST 5.2: Published AI audio frame #%s to LiveKit (%s samples)', self.audio_frames_published, samples_per_channel)
                 elif self.audio_frames_published % 50 == 0:
-                    print(f'[AI-AGENT] 📊 Published {self.audio_frames_published} audio frames so far...')
-                
-                # Small delay to prevent overwhelming
-                await asyncio.sleep(0.01)
+                    logger.info('[AI-AGENT] 📊 Published %s audio frames so far...', self.audio_frames_published)
                 
             except Exception as e:
-                print(f'[AI-AGENT] ❌ Error processing audio queue: {e}')
-                import traceback
-                traceback.print_exc()
+                logger.exception('[AI-AGENT] ❌ Error processing audio queue: %s', e)
     
     async def report_status(self):
         """Periodically report agent status"""
-        print('\n[AI-AGENT] Agent is running. Press Ctrl+C to stop.\n')
+        logger.info('\n[AI-AGENT] Agent is running. Press Ctrl+C to stop.\n')
         
         while True:
             await asyncio.sleep(10)
             
-            print('\n[AI-AGENT] ===== STATUS =====')
-            print(f'[AI-AGENT] Connected: {self.room is not None}')
-            print(f'[AI-AGENT] Room: {self.room.name if self.room else "N/A"}')
-            print(f'[AI-AGENT] Local participant: {self.room.local_participant.identity if self.room else "N/A"}')
-            print(f'[AI-AGENT] Remote participants: {len(self.room.remote_participants) if self.room else 0}')
+            # Skip building the report entirely when INFO is disabled
+            if not logger.isEnabledFor(logging.INFO):
+                continue
+            
+            logger.info('\n[AI-AGENT] ===== STATUS =====')
+            logger.info('[AI-AGENT] Connected: %s', self.room is not None)
+            logger.info('[AI-AGENT] Room: %s', self.room.name if self.room else "N/A")
+            logger.info('[AI-AGENT] Local participant: %s', self.room.local_participant.identity if self.room else "N/A")
+            logger.info('[AI-AGENT] Remote participants: %s', len(self.room.remote_participants) if self.room else 0)
             
             if self.subscribed_tracks:
                 for identity, stats in self.subscribed_tracks.items():
-                    print(f'[AI-AGENT]   - {identity} ({stats["frames"]} frames, {stats["bytes"]} bytes)')
-            
-            print(f'[AI-AGENT] Subscribed tracks: {len(self.subscribed_tracks)}')
-            print('[AI-AGENT] ==================\n')
+                    logger.info('[AI-AGENT]   - %s (%s frames, %s bytes)', identity, stats["frames"], stats["bytes"])
+            
+            logger.info('[AI-AGENT] Subscribed tracks: %s', len(self.subscribed_tracks))
+            if self.audio_chunks_dropped:
+                logger.info('[AI-AGENT] Dropped playback chunks: %s', self.audio_chunks_dropped)
+            if self.openai.audio_chunks_dropped:
+                logger.info('[AI-AGENT] Dropped outbound audio frames: %s', self.openai.audio_chunks_dropped)
+            logger.info('[AI-AGENT] ==================\n')
     
     async def disconnect(self):
         """Disconnect from room and OpenAI"""
-        print('[AI-AGENT] Shutting down...')
+        logger.info('[AI-AGENT] Shutting down...')
         
         if self.room:
-            print('[AI-AGENT] Disconnecting...')
+            logger.info('[AI-AGENT] Disconnecting...')
             await self.room.disconnect()
         
-        if self.openai.ws:
-            await self.openai.ws.close()
+        await self.openai.close()
         
-        print('[AI-AGENT] Disconnected')
+        logger.info('[AI-AGENT] Disconnected')
 
 
 async def main():
     """Main entry point"""
-    print('[AI-AGENT] Starting AI agent...')
-    print(f'[AI-AGENT] Identity: {AI_IDENTITY}')
-    print(f'[AI-AGENT] Target room: {TARGET_ROOM}')
-    print(f'[AI-AGENT] LiveKit URL: {LIVEKIT_URL}')
+    logger.info('[AI-AGENT] Starting AI agent...')
+    logger.info('[AI-AGENT] Identity: %s', AI_IDENTITY)
+    logger.info('[AI-AGENT] Target room: %s', TARGET_ROOM)
+    logger.info('[AI-AGENT] LiveKit URL: %s', LIVEKIT_URL)
     
     agent = AIAgent()
     
@@ -515,12 +903,16 @@ async def main():
             # Keep running until interrupted
             await asyncio.Event().wait()
     except KeyboardInterrupt:
-        print('\n[AI-AGENT] Received interrupt signal')
+        logger.info('\n[AI-AGENT] Received interrupt signal')
     except Exception as e:
-        print(f'[AI-AGENT] ❌ Error: {e}')
+        logger.error('[AI-AGENT] ❌ Error: %s', e)
     finally:
         await agent.disconnect()
 
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    logging.basicConfig(level=os.getenv('LOG_LEVEL', 'INFO').upper(), format='%(message)s')
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -2,9 +2,11 @@ import argparse
 import base64
 import json
 import os
+import struct
 import sys
-import wave
+import threading
 from dataclasses import dataclass
+from math import gcd
 from typing import Optional, Tuple
 
 import numpy as np
@@ -12,6 +14,52 @@ import soundfile as sf
 import websocket
 from openai import OpenAI
 
+# Polyphase resampler when SciPy is installed; linear interpolation otherwise.
+try:
+    from scipy.signal import decimate, resample_poly
+except ImportError:
+    decimate = resample_poly = None
+
+# JIT-compiled PCM16 conversion when numba is installed; NumPy otherwise.
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# SIMD base64 (SSSE3/AVX2) when available; stdlib otherwise.
+try:
+    import pybase64
+except ImportError:
+    pybase64 = None
+
+if pybase64 is not None:
+    BASE64_BACKEND = f"pybase64 {pybase64.get_version()}"  # e.g. "1.5.1 (C extension active - AVX2)"
+    b64encode = pybase64.b64encode
+
+    def b64decode(s) -> bytes:
+        return pybase64.b64decode(s, validate=False)
+else:
+    BASE64_BACKEND = "stdlib"
+    b64encode = base64.b64encode
+    b64decode = base64.b64decode
+
+# Fast JSON (orjson) when available; stdlib otherwise. json_dumps returns UTF-8 bytes,
+# which websocket-client still sends as a text frame.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+else:
+    json_loads = json.loads
+
+    def json_dumps(obj) -> bytes:
+        # Compact like orjson: no spaces after separators, no \uXXXX escaping of non-ASCII text.
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
 
 # -------------------------
 # Helpers
@@ -28,35 +76,165 @@ def print_err(*args):
     print(*args, file=sys.stderr)
 
 
+_openai_client: Optional[OpenAI] = None
+
+
+def get_openai() -> OpenAI:
+    """Shared OpenAI client, so repeated calls reuse its HTTPS connection pool."""
+    global _openai_client
+    if _openai_client is None:
+        _openai_client = OpenAI()  # reads OPENAI_API_KEY from env
+    return _openai_client
+
+
 def linear_resample_mono(x: np.ndarray, src_rate: int, dst_rate: int) -> np.ndarray:
-    """Simple linear resampler (MVP-quality)."""
+    """Resample mono audio: pair averaging for 2:1, FIR decimation / polyphase if SciPy is
+    available, else simple linear (MVP-quality)."""
     if src_rate == dst_rate:
         return x.astype(np.float32)
 
     if x.size == 0:
         return x.astype(np.float32)
 
-    duration = x.size / float(src_rate)
-    dst_len = int(round(duration * dst_rate))
-    src_idx = np.arange(x.size, dtype=np.float32)
-    dst_idx = np.linspace(0, x.size - 1, num=dst_len, dtype=np.float32)
-    y = np.interp(dst_idx, src_idx, x).astype(np.float32)
+    if src_rate == 2 * dst_rate:
+        # 2:1 (e.g. 48k -> 24k): average sample pairs, a cheap low-pass in one strided pass.
+        n = x.size - (x.size % 2)
+        return ((x[0:n:2] + x[1:n:2]) * 0.5).astype(np.float32, copy=False)
+
+    if decimate is not None and src_rate % dst_rate == 0:
+        return decimate(x, src_rate // dst_rate, ftype="fir").astype(np.float32, copy=False)
+
+    if resample_poly is not None:
+        g = gcd(src_rate, dst_rate)
+        return resample_poly(x, dst_rate // g, src_rate // g).astype(np.float32, copy=False)
+
+    dst_len = (x.size * dst_rate + src_rate // 2) // src_rate  # round(size * dst / src), in integers
+    # float64 is what np.interp works in; float32 indices would just be upcast copies.
+    dst_idx = np.linspace(0.0, x.size - 1, num=dst_len)
+    y = np.interp(dst_idx, np.arange(x.size, dtype=np.float64), x).astype(np.float32, copy=False)
     return y
 
 
-def float32_to_pcm16_bytes(x: np.ndarray) -> bytes:
-    """Float32 [-1,1] -> little-endian signed 16-bit PCM bytes."""
-    x = np.clip(x, -1.0, 1.0)
-    ints = (x * 32767.0).astype(np.int16)
+def _f32_to_pcm16_loop(x, out):
+    for i in prange(x.size):
+        v = x[i] * np.float32(32767.0)  # float32 math, same rounding as the NumPy path
+        if v < -32768.0:
+            v = -32768.0
+        elif v > 32767.0:
+            v = 32767.0
+        out[i] = np.int16(np.rint(v))
+
+
+if njit is not None:
+    # Compiled lazily (and cached on disk) so commands that never convert audio don't pay for it.
+    _f32_to_pcm16_jit = njit(cache=True, fastmath=True, parallel=True)(_f32_to_pcm16_loop)
+else:
+    _f32_to_pcm16_jit = None
+
+
+def float32_to_pcm16_bytes(x: np.ndarray, out: Optional[np.ndarray] = None) -> bytes:
+    """Float32 [-1,1] mono -> little-endian signed 16-bit PCM bytes.
+
+    `out` is an optional float32 scratch buffer shaped like `x`, reusable across calls
+    (only the NumPy path needs it).
+    """
+    if _f32_to_pcm16_jit is not None:
+        ints = np.empty(x.shape, dtype=np.int16)
+        _f32_to_pcm16_jit(x, ints)
+        return ints.tobytes()
+
+    if out is None:
+        out = np.empty(x.shape, dtype=np.float32)
+    # Scale, clip and round in place; no temporaries beyond the int16 result.
+    np.multiply(x, 32767.0, out=out)
+    np.clip(out, -32768.0, 32767.0, out=out)
+    ints = np.empty(x.shape, dtype=np.int16)
+    np.rint(out, out=ints, casting="unsafe")
     return ints.tobytes()
 
 
-def pcm16_bytes_to_wav(path: str, pcm16: bytes, rate: int, channels: int = 1):
-    with wave.open(path, "wb") as wf:
-        wf.setnchannels(channels)
-        wf.setsampwidth(2)  # 16-bit
-        wf.setframerate(rate)
-        wf.writeframes(pcm16)
+def resample_context(src_rate: int, dst_rate: int) -> int:
+    """Input samples on each side that one linear_resample_mono output sample depends on."""
+    if src_rate == dst_rate or src_rate == 2 * dst_rate or resample_poly is None:
+        return 0  # per-sample paths: pair averaging, or linear interpolation
+    if decimate is not None and src_rate % dst_rate == 0:
+        return 10 * (src_rate // dst_rate)  # decimate's default FIR half-length
+    g = gcd(src_rate, dst_rate)
+    up, down = dst_rate // g, src_rate // g
+    return -(-10 * max(up, down) // up)  # resample_poly's default half-length, in input samples
+
+
+def iter_pcm16_blocks(path: str, src_rate: int, dst_rate: int, blocksize: int = 65536):
+    """Stream an audio file as mono PCM16 bytes at dst_rate, one block at a time.
+
+    Overlap-save: each block is resampled together with enough neighbouring input to cover the
+    filter, and the matching output is trimmed, so SciPy's filters give the same result as
+    resampling the whole file. The linear fallback interpolates within each block.
+    """
+    period = src_rate // gcd(src_rate, dst_rate)
+    blocksize = max(period, blocksize // period * period)
+    ctx = -(-resample_context(src_rate, dst_rate) // period) * period  # period-aligned
+    empty = np.empty(0, dtype=np.float32)
+    left = empty  # input just before `cur`
+    cur = None  # block waiting for its right-hand context
+    scratch = None
+
+    def emit(right):
+        nonlocal scratch
+        y = linear_resample_mono(np.concatenate((left, cur, right)), src_rate, dst_rate)
+        lo = left.size * dst_rate // src_rate
+        y = y[lo:lo + cur.size * dst_rate // src_rate] if right.size else y[lo:]
+        if scratch is None or scratch.shape != y.shape:
+            scratch = np.empty(y.shape, dtype=np.float32)
+        return float32_to_pcm16_bytes(y, out=scratch)
+
+    for block in sf.blocks(path, blocksize=blocksize, dtype="float32", always_2d=True):
+        nxt = block[:, 0]  # first channel
+        if cur is not None:
+            yield emit(nxt[:ctx])
+            left = np.concatenate((left, cur))[-ctx:] if ctx else empty
+        cur = nxt
+    if cur is not None:
+        yield emit(empty)
+
+
+class WavWriter:
+    """Streaming PCM16 WAV writer: fixed 44-byte header up front, sizes patched on close.
+
+    Writes are plain file writes with no per-call header bookkeeping.
+    """
+
+    def __init__(self, path: str, rate: int, channels: int = 1):
+        self.f = open(path, "wb")
+        self.n = 0  # data bytes written
+        block_align = channels * 2
+        self.f.write(struct.pack(
+            "<4sI4s4sIHHIIHH4sI",
+            b"RIFF", 36, b"WAVE",
+            b"fmt ", 16, 1, channels, rate, rate * block_align, block_align, 16,
+            b"data", 0,
+        ))
+
+    def write(self, pcm16) -> None:
+        self.f.write(pcm16)
+        self.n += len(pcm16)
+
+    def close(self) -> None:
+        if self.f.closed:
+            return
+        try:
+            self.f.seek(4)
+            self.f.write(struct.pack("<I", 36 + self.n))
+            self.f.seek(40)
+            self.f.write(struct.pack("<I", self.n))
+        finally:
+            self.f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
 
 
 # -------------------------
@@ -64,7 +242,7 @@ def pcm16_bytes_to_wav(path: str, pcm16: bytes, rate: int, channels: int = 1):
 # -------------------------
 
 def cmd_stt(args):
-    client = OpenAI()  # reads OPENAI_API_KEY from env
+    client = get_openai()
     with open(args.file, "rb") as f:
         tx = client.audio.transcriptions.create(
             model=args.model,
@@ -84,7 +262,7 @@ def cmd_stt(args):
 # -------------------------
 
 def cmd_tts(args):
-    client = OpenAI()
+    client = get_openai()
     # Streaming-to-file is the simplest way to avoid buffering huge audio in memory.
     kwargs = {
         "model": args.model,
@@ -116,20 +294,86 @@ class RealtimeConfig:
     output_format: str = "audio/pcm"  # easiest to write to WAV
 
 
+# session.update for cmd_realtime_audio, serialized once; voice/instructions are spliced in per call.
+# Event schema follows the realtime conversations guide.
+_SESSION_UPDATE_TEMPLATE = json_dumps({
+    "type": "session.update",
+    "session": {
+        "type": "realtime",
+        "model": "gpt-realtime",
+        "output_modalities": ["text", "audio"],
+        "audio": {
+            "input": {
+                "format": {"type": "audio/pcm", "rate": 24000},
+                "turn_detection": None,
+            },
+            "output": {
+                "format": {"type": "audio/pcm"},
+                "voice": "__VOICE__",
+            },
+        },
+        "instructions": "__INSTR__",
+    },
+})
+
+
+def session_update_payload(voice: str, instructions: str) -> bytes:
+    # json_dumps of each value keeps quoting/escaping correct (and encodes None as null).
+    return (_SESSION_UPDATE_TEMPLATE
+            .replace(b'"__VOICE__"', json_dumps(voice), 1)
+            .replace(b'"__INSTR__"', json_dumps(instructions), 1))
+
+
 def ws_connect() -> websocket.WebSocket:
     key = require_api_key()
+    # No "Sec-WebSocket-Extensions: permessage-deflate" here: websocket-client cannot inflate
+    # compressed frames (it rejects RSV1), so a server that accepted the offer would break recv().
     headers = [f"Authorization: Bearer {key}"]
-    ws = websocket.create_connection(REALTIME_URL, header=headers)
+    # enable_multithread: sends may come from a sender thread while recv() (which answers pings) runs.
+    ws = websocket.create_connection(REALTIME_URL, header=headers, enable_multithread=True)
     return ws
 
 
 def ws_recv_json(ws: websocket.WebSocket) -> dict:
     msg = ws.recv()
-    return json.loads(msg)
+    return json_loads(msg)
 
 
 def ws_send_json(ws: websocket.WebSocket, obj: dict):
-    ws.send(json.dumps(obj))
+    ws.send(json_dumps(obj))
+
+
+# Pre-built JSON envelope for input_audio_buffer.append (base64 needs no escaping)
+APPEND_PREFIX = b'{"type":"input_audio_buffer.append","audio":"'
+APPEND_SUFFIX = b'"}'
+
+
+def send_audio_append(ws: websocket.WebSocket, pcm16):
+    """Send one input_audio_buffer.append without going through the JSON encoder."""
+    ws.send(b"".join((APPEND_PREFIX, b64encode(pcm16), APPEND_SUFFIX)))
+
+
+def send_audio_input(ws: websocket.WebSocket, pcm16_blocks):
+    """Append PCM16 audio in chunks, then commit and request a response (runs on a sender thread)."""
+    try:
+        # Gather blocks into large base64 chunks. Large chunks mean fewer WS frames / TLS records /
+        # syscalls, while staying far below the API's per-event size limit.
+        chunk_bytes = 240_000  # ~5s @ 24kHz * 2 bytes
+        pending = bytearray()
+        for block in pcm16_blocks:
+            pending += block
+            if len(pending) >= chunk_bytes:
+                send_audio_append(ws, pending)
+                pending.clear()
+        if pending:
+            send_audio_append(ws, pending)
+
+        # Commit buffer => creates user audio item; then request response
+        ws_send_json(ws, {"type": "input_audio_buffer.commit"})
+        ws_send_json(ws, {"type": "response.create", "response": {"output_modalities": ["text", "audio"]}})
+    except Exception as e:
+        print_err("Audio upload failed:", e)
+        ws.abort()  # wake the receiving thread
 
 
 def cmd_realtime_text(args):
@@ -174,89 +418,76 @@ def cmd_realtime_audio(args):
     """
     Sends a WAV file as audio input (PCM16 @ 24k), then saves model audio output to out.wav.
     For MVP simplicity, we:
-      - resample to 24k mono
+      - stream the file in blocks, resampled to 24k mono
       - send audio via input_audio_buffer.append + commit
       - request output modalities ["text","audio"]
-      - collect output_audio.delta chunks and write to a WAV
+      - stream output_audio.delta chunks straight into a WAV
     """
     ws = ws_connect()
-    out_pcm = bytearray()
+    sender = None
     got_text = []
 
     try:
         first = ws_recv_json(ws)
         print_err("Connected. First event:", first.get("type"))
+        print_err("base64 backend:", BASE64_BACKEND)
 
-        # Read WAV (or any audio soundfile supports), convert to mono float32
-        data, sr = sf.read(args.wav, dtype="float32")
-        if data.ndim > 1:
-            data = data[:, 0]  # mono
-        data = linear_resample_mono(data, sr, 24000)
-        pcm16 = float32_to_pcm16_bytes(data)
+        # Stream the WAV (or any audio soundfile supports) block by block as mono PCM16 @ 24k
+        info = sf.info(args.wav)
+        if info.samplerate == 24000 and info.channels == 1 and info.subtype == "PCM_16":
+            # Already in the session's input format: send the samples as-is, no float32 round trip
+            pcm16_blocks = (b.tobytes() for b in sf.blocks(args.wav, blocksize=65536, dtype="int16"))
+        else:
+            pcm16_blocks = iter_pcm16_blocks(args.wav, info.samplerate, 24000)
 
         # Configure session: request both text + audio, set formats, disable auto turn detection (push-to-talk)
-        # Event schema follows the realtime conversations guide.
-        ws_send_json(ws, {
-            "type": "session.update",
-            "session": {
-                "type": "realtime",
-                "model": "gpt-realtime",
-                "output_modalities": ["text", "audio"],
-                "audio": {
-                    "input": {
-                        "format": {"type": "audio/pcm", "rate": 24000},
-                        "turn_detection": None,
-                    },
-                    "output": {
-                        "format": {"type": "audio/pcm"},
-                        "voice": args.voice,
-                    },
-                },
-                "instructions": args.instructions,
-            },
-        })
+        ws.send(session_update_payload(args.voice, args.instructions))
 
         # Clear any old buffered audio (safe)
         ws_send_json(ws, {"type": "input_audio_buffer.clear"})
 
-        # Chunk and send audio (base64). Keep chunks reasonably sized.
-        chunk_bytes = 32000  # ~0.66s @ 24kHz * 2 bytes
-        for i in range(0, len(pcm16), chunk_bytes):
-            chunk = pcm16[i:i + chunk_bytes]
-            b64 = base64.b64encode(chunk).decode("ascii")
-            ws_send_json(ws, {"type": "input_audio_buffer.append", "audio": b64})
-
-        # Commit buffer => creates user audio item; then request response
-        ws_send_json(ws, {"type": "input_audio_buffer.commit"})
-        ws_send_json(ws, {"type": "response.create", "response": {"output_modalities": ["text", "audio"]}})
+        # Upload on a background thread so server events are received while audio is still sending
+        sender = threading.Thread(target=send_audio_input, args=(ws, pcm16_blocks), daemon=True)
+        sender.start()
 
         print_err("Streaming response...")
 
-        while True:
-            ev = ws_recv_json(ws)
-            t = ev.get("type", "")
-
-            # Text deltas
-            if t == "response.output_text.delta":
-                got_text.append(ev.get("delta", ""))
-                sys.stdout.write(ev.get("delta", ""))
-                sys.stdout.flush()
-
-            # Audio deltas (docs mention response.output_audio.delta; some older snippets use response.audio.delta)
-            if t in ("response.output_audio.delta", "response.audio.delta"):
-                b64 = ev.get("delta") or ev.get("audio") or ""
-                if b64:
-                    out_pcm.extend(base64.b64decode(b64))
-
-            if t == "response.done":
-                print()  # newline
-                break
+        # Write model audio to disk as it arrives; closing the file patches the WAV header sizes.
+        with WavWriter(args.out, 24000) as wf:
+            b64_parts = []  # audio deltas are decoded in batches; one large decode beats many small ones
+
+            while True:
+                ev = ws_recv_json(ws)
+                t = ev.get("type", "")
+
+                # Text deltas
+                if t == "response.output_text.delta":
+                    got_text.append(ev.get("delta", ""))
+                    sys.stdout.write(ev.get("delta", ""))
+                    sys.stdout.flush()
+
+                # Audio deltas (docs mention response.output_audio.delta; some older snippets use response.audio.delta)
+                if t in ("response.output_audio.delta", "response.audio.delta"):
+                    b64 = ev.get("delta") or ev.get("audio") or ""
+                    if b64:
+                        b64_parts.append(b64)
+                        # A padded (or unaligned) delta ends a base64 run, so it can't be joined with the next one.
+                        if len(b64_parts) >= 16 or b64.endswith("=") or len(b64) % 4:
+                            wf.write(b64decode("".join(b64_parts)))
+                            b64_parts.clear()
+
+                if t == "response.done":
+                    if b64_parts:
+                        wf.write(b64decode("".join(b64_parts)))
+                    print()  # newline
+                    break
 
-        pcm16_bytes_to_wav(args.out, bytes(out_pcm), rate=24000, channels=1)
         print_err(f"Saved model audio to: {args.out}")
 
     finally:
         ws.close()
+        if sender is not None:
+            sender.join()
 
 
 # -------------------------